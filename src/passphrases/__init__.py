@@ -9,15 +9,81 @@ This package follows Model-View-Controller (MVC) architecture:
 
 __version__ = "0.1.0"
 
-# Import main components for easy access
-from .controllers.application_controller import ApplicationController
-from .controllers.passphrase_controller import PassphraseController
-from .models.passphrase_model import PassphraseModel
-from .models.word_repository import WordRepository
-from .views.cli_view import CLIView
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 
-# Create default application controller instance
-_default_app = ApplicationController()
+if TYPE_CHECKING:
+    from .controllers.application_controller import ApplicationController
+
+# Public classes are imported on first access (PEP 562) so that a bare
+# ``import passphrases`` does not pull in the controllers and NLTK.
+_LAZY_IMPORTS = {
+    'ApplicationController': '.controllers.application_controller',
+    'PassphraseController': '.controllers.passphrase_controller',
+    'PassphraseModel': '.models.passphrase_model',
+    'WordRepository': '.models.word_repository',
+    'CLIView': '.views.cli_view',
+}
+
+# Default application controller instance, created on first use
+_default_app: Optional['ApplicationController'] = None
+_default_app_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import public classes lazily on first attribute access.
+    
+    Args:
+        name: Attribute name being looked up
+        
+    Returns:
+        The requested class
+        
+    Raises:
+        AttributeError: If the name is not a lazily exported symbol
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _get_default_app() -> 'ApplicationController':
+    """
+    Get the default application controller, creating it on first call.
+    
+    Construction is guarded by a lock so concurrent first callers share a
+    single instance instead of each loading the word repository.
+    
+    Returns:
+        ApplicationController: Shared default controller instance
+    """
+    global _default_app
+    if _default_app is None:
+        with _default_app_lock:
+            if _default_app is None:
+                from .controllers.application_controller import ApplicationController
+                _default_app = ApplicationController()
+    return _default_app
+
+
+def _prewarm() -> None:
+    """
+    Build the default application, which loads its word list.
+    """
+    _get_default_app()
+
+
+# Optionally load the word corpus in the background so it is ready by the
+# time the first passphrase is requested
+if os.environ.get('PASSPHRASES_PREWARM') == '1':
+    threading.Thread(target=_prewarm, name='passphrases-prewarm', daemon=True).start()
 
 
 def hello_world() -> str:
@@ -27,7 +93,8 @@ def hello_world() -> str:
     Returns:
         str: A greeting message
     """
-    return _default_app.hello_world()
+    from .controllers.application_controller import HELLO_WORLD_MESSAGE
+    return HELLO_WORLD_MESSAGE
 
 
 def generate_passphrase(**kwargs) -> str:
@@ -47,22 +114,24 @@ def generate_passphrase(**kwargs) -> str:
         >>> generate_passphrase(word_count=3, separator='_')
         'Apple_Mountain_Ocean'
     """
-    result = _default_app.generate_quick_passphrase(**kwargs)
-    return result.get('passphrase', 'Error generating passphrase')
+    try:
+        return _get_default_app().generate_quick_passphrase_string(**kwargs)
+    except ValueError:
+        return 'Error generating passphrase'
 
 
 def run_interactive() -> None:
     """
     Run the application in interactive mode.
     """
-    _default_app.run_interactive_mode()
+    _get_default_app().run_interactive_mode()
 
 
 def demo() -> None:
     """
     Run a demonstration of the passphrase generation capabilities.
     """
-    _default_app.demo_generation()
+    _get_default_app().demo_generation()
 
 
 # Export main components
@@ -0,0 +1,3 @@
+"""
+Commands package - Optional CLI commands, imported only when they are run.
+"""
\ No newline at end of file
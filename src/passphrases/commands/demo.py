@@ -0,0 +1,38 @@
+"""
+Demo command - Demonstrates passphrase generation with sample configurations.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..controllers.application_controller import ApplicationController
+
+
+# Sample passphrase configurations shown by the demo
+DEMO_CONFIGS = [
+    {'word_count': 4, 'separator': '-', 'capitalize': True},
+    {'word_count': 3, 'separator': '_', 'capitalize': False},
+    {'word_count': 5, 'separator': ' ', 'capitalize': True, 'include_numbers': True}
+]
+
+
+def run(app: 'ApplicationController') -> None:
+    """
+    Run a demonstration of the passphrase generation capabilities.
+    
+    Args:
+        app: Application controller providing the view and passphrase controller
+    """
+    app.view.display_info("Passphrase Generation Demo")
+    
+    for i, config in enumerate(DEMO_CONFIGS, 1):
+        app.view.display_info(f"Example {i}:")
+        try:
+            result = app.passphrase_controller.generate_passphrase_result(**config)
+        except ValueError:
+            continue
+        app.view.display_passphrase(
+            passphrase=result.passphrase,
+            word_count=result.word_count,
+            word_pool_size=result.word_pool_size
+        )
\ No newline at end of file
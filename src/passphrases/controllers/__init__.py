@@ -2,7 +2,7 @@
 Controllers package - Contains application logic and coordinates models and views.
 """
 
-from .passphrase_controller import PassphraseController
+from .passphrase_controller import PassphraseController, PassphraseResult
 from .application_controller import ApplicationController
 
-__all__ = ['PassphraseController', 'ApplicationController']
\ No newline at end of file
+__all__ = ['PassphraseController', 'PassphraseResult', 'ApplicationController']
\ No newline at end of file
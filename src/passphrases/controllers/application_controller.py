@@ -4,11 +4,15 @@ Application controller - Main controller coordinating the entire application.
 
 from typing import Optional, List, Dict, Any
 from ..models.passphrase_model import PassphraseModel
-from ..models.word_repository import WordRepository
+from ..models.word_repository import WordRepository, get_word_repository
 from ..views.cli_view import CLIView
 from .passphrase_controller import PassphraseController
 
 
+# Greeting returned by both hello_world() implementations
+HELLO_WORLD_MESSAGE = "Hello, World! Welcome to the Passphrases project (MVC Architecture)!"
+
+
 class ApplicationController:
     """
     Main application controller that coordinates passphrase generation operations.
@@ -27,7 +31,7 @@ class ApplicationController:
             word_repository: Word repository instance
         """
         self.view = view or CLIView()
-        self.word_repository = word_repository or WordRepository()
+        self.word_repository = word_repository or get_word_repository()
         
         # Initialize models
         self.passphrase_model = PassphraseModel(self.word_repository)
@@ -38,6 +42,19 @@ class ApplicationController:
             view=self.view,
             word_repository=self.word_repository
         )
+        
+        # Exact-match interactive commands; prefixed commands are handled
+        # by _dispatch_prefixed_command
+        self._running = False
+        self._commands = {
+            'quit': self._quit,
+            'exit': self._quit,
+            'q': self._quit,
+            'help': self.view.display_help,
+            'h': self.view.display_help,
+            '?': self.view.display_help,
+            'stats': self._display_statistics,
+        }
     
     def run_interactive_mode(self) -> None:
         """
@@ -45,27 +62,19 @@ class ApplicationController:
         """
         self.view.display_welcome()
         
-        while True:
+        self._running = True
+        while self._running:
             try:
                 command = self.view.prompt_input("Enter command (help for options, quit to exit):").strip().lower()
                 
                 if not command:
                     continue
                 
-                if command in ['quit', 'exit', 'q']:
-                    self.view.display_info("Goodbye!")
-                    break
-                elif command in ['help', 'h', '?']:
-                    self.view.display_help()
-                elif command.startswith('generate') or command.startswith('passphrase'):
-                    self._generate_passphrase_interactive()
-                elif command.startswith('bulk'):
-                    self._handle_bulk_command(command)
-                elif command == 'stats':
-                    self._display_statistics()
+                handler = self._commands.get(command)
+                if handler:
+                    handler()
                 else:
-                    self.view.display_error(f"Unknown command: {command}")
-                    self.view.display_info("Type 'help' for available commands")
+                    self._dispatch_prefixed_command(command)
             
             except KeyboardInterrupt:
                 self.view.display_info("\nGoodbye!")
@@ -73,17 +82,33 @@ class ApplicationController:
             except Exception as e:
                 self.view.display_error(f"Unexpected error: {str(e)}")
     
-
+    def _quit(self) -> None:
+        """Stop the interactive loop."""
+        self.view.display_info("Goodbye!")
+        self._running = False
     
-    def _handle_bulk_command(self, command: str) -> None:
+    def _dispatch_prefixed_command(self, command: str) -> None:
         """
-        Handle bulk generation commands.
+        Handle commands that take arguments.
         
         Args:
             command: The full command string
         """
-        parts = command.split()
+        if command.startswith('generate') or command.startswith('passphrase'):
+            self._generate_passphrase_interactive()
+        elif command.startswith('bulk'):
+            self._handle_bulk_command(command.split())
+        else:
+            self.view.display_error(f"Unknown command: {command}")
+            self.view.display_info("Type 'help' for available commands")
+    
+    def _handle_bulk_command(self, parts: List[str]) -> None:
+        """
+        Handle bulk generation commands.
         
+        Args:
+            parts: The command split into words
+        """
         if len(parts) < 4:
             self.view.display_error("Usage: bulk generate <count> <type>")
             return
@@ -149,6 +174,23 @@ class ApplicationController:
         """
         return self.passphrase_controller.generate_passphrase(**kwargs)
     
+    def generate_quick_passphrase_string(self, **kwargs) -> str:
+        """
+        Generate a passphrase and return only the passphrase string.
+        
+        Unlike generate_quick_passphrase, no metadata is computed.
+        
+        Args:
+            **kwargs: Passphrase generation parameters
+            
+        Returns:
+            str: Generated passphrase
+            
+        Raises:
+            ValueError: If the generation parameters are invalid
+        """
+        return self.passphrase_model.generate(**kwargs)
+    
 
     
     def hello_world(self) -> str:
@@ -158,27 +200,11 @@ class ApplicationController:
         Returns:
             str: Welcome message
         """
-        return "Hello, World! Welcome to the Passphrases project (MVC Architecture)!"
+        return HELLO_WORLD_MESSAGE
     
     def demo_generation(self) -> None:
         """
         Run a demonstration of the passphrase generation capabilities.
         """
-        self.view.display_info("Passphrase Generation Demo")
-        
-        # Generate sample passphrases with different configurations
-        configs = [
-            {'word_count': 4, 'separator': '-', 'capitalize': True},
-            {'word_count': 3, 'separator': '_', 'capitalize': False},
-            {'word_count': 5, 'separator': ' ', 'capitalize': True, 'include_numbers': True}
-        ]
-        
-        for i, config in enumerate(configs, 1):
-            self.view.display_info(f"Example {i}:")
-            passphrase_result = self.generate_quick_passphrase(**config)
-            if 'error' not in passphrase_result:
-                self.view.display_passphrase(
-                    passphrase=passphrase_result['passphrase'],
-                    word_count=passphrase_result['word_count'],
-                    word_pool_size=passphrase_result['word_pool_size']
-                )
\ No newline at end of file
+        from ..commands.demo import run
+        run(self)
\ No newline at end of file
@@ -2,12 +2,25 @@
 Passphrase controller - Handles passphrase generation requests.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
 from ..models.passphrase_model import PassphraseModel
-from ..models.word_repository import WordRepository
+from ..models.word_repository import WordRepository, get_word_repository
 from ..views.cli_view import CLIView
 
 
+class PassphraseResult(NamedTuple):
+    """
+    A generated passphrase together with its generation metadata.
+    """
+    
+    passphrase: str
+    word_count: int
+    word_pool_size: int
+    separator: str
+    capitalized: bool
+    includes_numbers: bool
+
+
 class PassphraseController:
     """
     Controller for managing passphrase generation operations.
@@ -27,10 +40,48 @@ class PassphraseController:
             view: CLI view instance
             word_repository: Word repository instance
         """
-        self.word_repository = word_repository or WordRepository()
+        self.word_repository = word_repository or get_word_repository()
         self.model = model or PassphraseModel(self.word_repository)
         self.view = view or CLIView()
     
+    def generate_passphrase_result(
+        self,
+        word_count: Optional[int] = None,
+        separator: Optional[str] = None,
+        capitalize: bool = True,
+        include_numbers: bool = False
+    ) -> PassphraseResult:
+        """
+        Generate a passphrase and return it as a PassphraseResult.
+        
+        Args:
+            word_count: Number of words
+            separator: Word separator
+            capitalize: Whether to capitalize words
+            include_numbers: Whether to include numbers
+            
+        Returns:
+            PassphraseResult containing passphrase and metadata
+            
+        Raises:
+            ValueError: If the generation parameters are invalid
+        """
+        passphrase = self.model.generate(
+            word_count=word_count,
+            separator=separator,
+            capitalize=capitalize,
+            include_numbers=include_numbers
+        )
+        
+        return PassphraseResult(
+            passphrase=passphrase,
+            word_count=word_count or self.model.default_word_count,
+            word_pool_size=self.model.get_word_pool_size(),
+            separator=separator or self.model.default_separator,
+            capitalized=capitalize,
+            includes_numbers=include_numbers
+        )
+    
     def generate_passphrase(
         self,
         word_count: Optional[int] = None,
@@ -51,25 +102,12 @@ class PassphraseController:
             Dict containing passphrase and metadata
         """
         try:
-            # Generate passphrase
-            passphrase = self.model.generate(
+            return self.generate_passphrase_result(
                 word_count=word_count,
                 separator=separator,
                 capitalize=capitalize,
                 include_numbers=include_numbers
-            )
-            
-            # Calculate metadata
-            actual_word_count = word_count or self.model.default_word_count
-            
-            return {
-                'passphrase': passphrase,
-                'word_count': actual_word_count,
-                'word_pool_size': self.model.get_word_pool_size(),
-                'separator': separator or self.model.default_separator,
-                'capitalized': capitalize,
-                'includes_numbers': include_numbers
-            }
+            )._asdict()
             
         except ValueError as e:
             return {
@@ -95,44 +133,63 @@ class PassphraseController:
         Returns:
             bool: True if successful, False if there was an error
         """
-        result = self.generate_passphrase(
-            word_count=word_count,
-            separator=separator,
-            capitalize=capitalize,
-            include_numbers=include_numbers
-        )
-        
-        if 'error' in result:
-            self.view.display_error(result['error'])
+        try:
+            result = self.generate_passphrase_result(
+                word_count=word_count,
+                separator=separator,
+                capitalize=capitalize,
+                include_numbers=include_numbers
+            )
+        except ValueError as e:
+            self.view.display_error(str(e))
             return False
         
         self.view.display_passphrase(
-            passphrase=result['passphrase'],
-            word_count=result['word_count'],
-            word_pool_size=result['word_pool_size']
+            passphrase=result.passphrase,
+            word_count=result.word_count,
+            word_pool_size=result.word_pool_size
         )
         
         return True
     
-    def generate_bulk_passphrases(self, count: int, **kwargs) -> list:
+    def generate_bulk_passphrases(
+        self,
+        count: int,
+        word_count: Optional[int] = None,
+        separator: Optional[str] = None,
+        capitalize: bool = True,
+        include_numbers: bool = False,
+        fast: bool = False
+    ) -> list:
         """
         Generate multiple passphrases.
         
+        All words for the batch are drawn in a single call and no per-item
+        metadata is built, which is much faster than calling
+        generate_passphrase() in a loop.
+        
         Args:
             count: Number of passphrases to generate
-            **kwargs: Additional parameters for passphrase generation
+            word_count: Number of words per passphrase
+            separator: Word separator
+            capitalize: Whether to capitalize words
+            include_numbers: Whether to include numbers
+            fast: Use NumPy's non-cryptographic generator (see PassphraseModel.generate_bulk)
             
         Returns:
             List of generated passphrases
         """
-        passphrases = []
-        
-        for _ in range(count):
-            result = self.generate_passphrase(**kwargs)
-            if 'error' not in result:
-                passphrases.append(result['passphrase'])
-        
-        return passphrases
+        try:
+            return self.model.generate_bulk(
+                count,
+                word_count=word_count,
+                separator=separator,
+                capitalize=capitalize,
+                include_numbers=include_numbers,
+                fast=fast
+            )
+        except ValueError:
+            return []
     
     def display_bulk_passphrases(self, count: int, **kwargs) -> None:
         """
@@ -142,20 +199,16 @@ class PassphraseController:
             count: Number of passphrases to generate
             **kwargs: Additional parameters for passphrase generation
         """
-        try:
-            if count < 1 or count > 100:
-                self.view.display_error("Count must be between 1 and 100")
-                return
-            
-            passphrases = self.generate_bulk_passphrases(count, **kwargs)
-            
-            if passphrases:
-                self.view.display_bulk_passphrases(passphrases)
-            else:
-                self.view.display_error("Failed to generate passphrases")
-                
-        except Exception as e:
-            self.view.display_error(f"Error generating passphrases: {str(e)}")
+        if count < 1 or count > 100:
+            self.view.display_error("Count must be between 1 and 100")
+            return
+        
+        passphrases = self.generate_bulk_passphrases(count, **kwargs)
+        
+        if passphrases:
+            self.view.display_bulk_passphrases(passphrases)
+        else:
+            self.view.display_error("Failed to generate passphrases")
     
     def get_word_repository_info(self) -> Dict[str, Any]:
         """
@@ -166,7 +219,7 @@ class PassphraseController:
         """
         return {
             'word_count': self.word_repository.get_word_count(),
-            'sample_words': self.word_repository.get_all_words()[:10]
+            'sample_words': list(self.word_repository.get_words_snapshot()[:10])
         }
     
     def display_word_repository_info(self) -> None:
@@ -7,10 +7,6 @@ with the original function signatures.
 
 import sys
 import argparse
-from typing import Optional
-
-from .controllers.application_controller import ApplicationController
-from .models.word_repository import WordRepository
 
 
 # Backwards compatibility functions (using original signatures)
@@ -30,13 +26,16 @@ def generate_passphrase(
     Returns:
         str: Generated passphrase
     """
-    app = ApplicationController()
-    result = app.generate_quick_passphrase(
-        word_count=word_count,
-        separator=separator,
-        capitalize=capitalize
-    )
-    return result.get('passphrase', 'Error generating passphrase')
+    from . import _get_default_app
+    
+    try:
+        return _get_default_app().generate_quick_passphrase_string(
+            word_count=word_count,
+            separator=separator,
+            capitalize=capitalize
+        )
+    except ValueError:
+        return 'Error generating passphrase'
 
 
 
@@ -111,6 +110,10 @@ Examples:
     
     args = parser.parse_args()
     
+    # Imported only after argument parsing so --help stays fast
+    from .controllers.application_controller import ApplicationController
+    from .models.word_repository import WordRepository
+    
     # Create application controller with custom word repository if needed
     word_repo = WordRepository(min_length=args.min_length, max_length=args.max_length)
     app = ApplicationController(word_repository=word_repo)
@@ -122,7 +125,8 @@ Examples:
         
         elif args.command == 'demo':
             # Demo mode
-            app.demo_generation()
+            from .commands.demo import run as run_demo
+            run_demo(app)
         
         elif args.command == 'passphrase':
             # Generate passphrase(s)
@@ -2,7 +2,37 @@
 Models package - Contains data structures and business logic for passphrase generation.
 """
 
-from .passphrase_model import PassphraseModel
-from .word_repository import WordRepository
+from typing import Any
 
-__all__ = ['PassphraseModel', 'WordRepository']
\ No newline at end of file
+# Submodules are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    'PassphraseModel': '.passphrase_model',
+    'WordRepository': '.word_repository',
+    'get_word_repository': '.word_repository',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import model classes lazily on first attribute access.
+    
+    Args:
+        name: Attribute name being looked up
+        
+    Returns:
+        The requested object
+        
+    Raises:
+        AttributeError: If the name is not a lazily exported symbol
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = ['PassphraseModel', 'WordRepository', 'get_word_repository']
\ No newline at end of file
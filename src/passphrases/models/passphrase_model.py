@@ -2,8 +2,67 @@
 Passphrase model - Business logic for passphrase generation.
 """
 
-from typing import List, Optional
-from .word_repository import WordRepository
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+import functools
+import os
+from .word_repository import WordRepository, get_word_repository
+
+
+def _random_numbers(count: int) -> List[int]:
+    """
+    Draw uniformly distributed numbers in the range 0-99.
+    
+    All numbers come from a single os.urandom() block (topped up only in the
+    rare case too many bytes are rejected) instead of one call per number.
+    
+    Args:
+        count: How many numbers to draw
+        
+    Returns:
+        List[int]: Random numbers between 0 and 99
+    """
+    numbers: List[int] = []
+    while len(numbers) < count:
+        # Bytes >= 200 are rejected so that byte % 100 stays uniform
+        numbers.extend(byte % 100 for byte in os.urandom(2 * (count - len(numbers))) if byte < 200)
+    return numbers[:count]
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_formatter(
+    separator: str,
+    capitalize: bool,
+    include_numbers: bool
+) -> Callable[[Sequence[str]], str]:
+    """
+    Build a formatter specialized for one set of formatting options.
+    
+    Args:
+        separator: Character to separate words
+        capitalize: Whether to capitalize first letter of each word
+        include_numbers: Whether to append random numbers to words
+        
+    Returns:
+        Callable turning a sequence of words into a passphrase
+    """
+    join = separator.join
+    
+    if capitalize and include_numbers:
+        def format_words(words: Sequence[str]) -> str:
+            numbers = _random_numbers(len(words))
+            return join(f"{word.capitalize()}{number:02d}" for word, number in zip(words, numbers))
+    elif capitalize:
+        def format_words(words: Sequence[str]) -> str:
+            return join(map(str.capitalize, words))
+    elif include_numbers:
+        def format_words(words: Sequence[str]) -> str:
+            numbers = _random_numbers(len(words))
+            return join(f"{word}{number:02d}" for word, number in zip(words, numbers))
+    else:
+        def format_words(words: Sequence[str]) -> str:
+            return join(words)
+    
+    return format_words
 
 
 class PassphraseModel:
@@ -16,13 +75,18 @@ class PassphraseModel:
         Initialize the passphrase model.
         
         Args:
-            word_repository: Repository for word data. If None, creates default repository.
+            word_repository: Repository for word data. If None, uses the shared default repository.
         """
-        self.word_repository = word_repository or WordRepository()
+        self.word_repository = word_repository or get_word_repository()
         self.min_word_count = 2
         self.max_word_count = 10
         self.default_word_count = 4
         self.default_separator = "-"
+        
+        # NumPy copies of the word list and generator for fast bulk
+        # generation, built on demand
+        self._word_arrays: Optional[Tuple[Tuple[str, ...], Any, Any]] = None
+        self._fast_rng: Any = None
     
     def generate(
         self,
@@ -51,18 +115,158 @@ class PassphraseModel:
         
         self._validate_word_count(word_count)
         
-        # Get random words
+        # Get random words; only the chosen words are capitalized
         words = self.word_repository.get_random_words(word_count)
         
-        # Apply transformations
-        if capitalize:
-            words = [word.capitalize() for word in words]
+        return self.compile_formatter(separator, capitalize, include_numbers)(words)
+    
+    def generate_bulk(
+        self,
+        count: int,
+        word_count: Optional[int] = None,
+        separator: Optional[str] = None,
+        capitalize: bool = True,
+        include_numbers: bool = False,
+        fast: bool = False
+    ) -> List[str]:
+        """
+        Generate multiple passphrases at once.
+        
+        Parameters are validated once and all words for the batch are drawn
+        in a single call. Words are unique within each passphrase.
+        
+        With fast=True the words and numbers are drawn with a NumPy generator
+        (PCG64DXSM, or xoshiro256++ when randomgen is installed), which is
+        much faster for very large batches but is NOT cryptographically
+        secure: use it for test data, never for real credentials. NumPy must
+        be installed (``pip install passphrases[fast]``).
+        
+        Args:
+            count: Number of passphrases to generate
+            word_count: Number of words per passphrase (uses default if None)
+            separator: Character to separate words (uses default if None)
+            capitalize: Whether to capitalize first letter of each word
+            include_numbers: Whether to append random numbers to words
+            fast: Whether to use the non-cryptographic NumPy generator
+            
+        Returns:
+            List[str]: Generated passphrases
+            
+        Raises:
+            ValueError: If word_count is invalid
+            ImportError: If fast is True and NumPy is not installed
+        """
+        word_count = word_count or self.default_word_count
+        separator = separator or self.default_separator
+        
+        self._validate_word_count(word_count)
+        
+        if count < 1:
+            return []
+        
+        if fast:
+            return self._generate_bulk_fast(count, word_count, separator, capitalize, include_numbers)
+        
+        groups = self.word_repository.get_random_words_bulk(count, word_count, capitalize=capitalize)
+        
+        # Words were drawn from the capitalized list already
+        format_words = self.compile_formatter(separator, False, include_numbers)
+        return [format_words(group) for group in groups]
+    
+    def _generate_bulk_fast(
+        self,
+        count: int,
+        word_count: int,
+        separator: str,
+        capitalize: bool,
+        include_numbers: bool
+    ) -> List[str]:
+        """
+        Generate multiple passphrases with NumPy's non-cryptographic generator.
+        
+        Args:
+            count: Number of passphrases to generate
+            word_count: Number of words per passphrase
+            separator: Character to separate words
+            capitalize: Whether to capitalize first letter of each word
+            include_numbers: Whether to append random numbers to words
+            
+        Returns:
+            List[str]: Generated passphrases
+        """
+        import numpy as np
+        
+        words = self.word_repository.get_words_snapshot()
+        if self._word_arrays is None or self._word_arrays[0] is not words:
+            self._word_arrays = (
+                words,
+                np.array(words, dtype=object),
+                np.array(self.word_repository.get_capitalized_words(), dtype=object)
+            )
+        pool = self._word_arrays[2] if capitalize else self._word_arrays[1]
+        
+        rng = self._get_fast_rng()
+        indices = rng.integers(0, len(words), size=(count, word_count))
+        
+        # Integers are drawn with replacement; redraw the rows with a repeated word
+        sorted_indices = np.sort(indices, axis=1)
+        for row in np.flatnonzero((sorted_indices[:, 1:] == sorted_indices[:, :-1]).any(axis=1)):
+            indices[row] = rng.choice(len(words), size=word_count, replace=False)
+        
+        rows = pool[indices].tolist()
         
         if include_numbers:
-            import secrets
-            words = [f"{word}{secrets.randbelow(100):02d}" for word in words]
+            numbers = rng.integers(0, 100, size=(count, word_count)).tolist()
+            return [
+                separator.join(f"{word}{number:02d}" for word, number in zip(row, row_numbers))
+                for row, row_numbers in zip(rows, numbers)
+            ]
         
-        return separator.join(words)
+        return [separator.join(row) for row in rows]
+    
+    def _get_fast_rng(self) -> Any:
+        """
+        Get the non-cryptographic generator used for fast bulk generation.
+        
+        Returns:
+            numpy.random.Generator: Generator backed by xoshiro256++ if
+            randomgen is installed, otherwise by NumPy's PCG64DXSM
+        """
+        if self._fast_rng is None:
+            import numpy as np
+            
+            try:
+                from randomgen import Xoshiro256
+                bit_generator = Xoshiro256()
+            except ImportError:
+                bit_generator = np.random.PCG64DXSM()
+            
+            self._fast_rng = np.random.Generator(bit_generator)
+        
+        return self._fast_rng
+    
+    def compile_formatter(
+        self,
+        separator: Optional[str] = None,
+        capitalize: bool = True,
+        include_numbers: bool = False
+    ) -> Callable[[Sequence[str]], str]:
+        """
+        Get a formatter that turns selected words into a passphrase.
+        
+        The returned callable has the options baked in, so bulk generation
+        can format many word groups without re-checking them per passphrase.
+        Formatters are cached per option set.
+        
+        Args:
+            separator: Character to separate words (uses default if None)
+            capitalize: Whether to capitalize first letter of each word
+            include_numbers: Whether to append random numbers to words
+            
+        Returns:
+            Callable taking a sequence of words and returning a passphrase
+        """
+        return _compile_formatter(separator or self.default_separator, capitalize, include_numbers)
     
     def _validate_word_count(self, word_count: int) -> None:
         """
@@ -74,6 +278,12 @@ class PassphraseModel:
         Raises:
             ValueError: If word count is invalid
         """
+        available_words = self.word_repository.get_word_count()
+        if (isinstance(word_count, int)
+                and self.min_word_count <= word_count <= min(self.max_word_count, available_words)):
+            return
+        
+        # Invalid: work out which rule was broken
         if not isinstance(word_count, int):
             raise ValueError("Word count must be an integer")
         
@@ -83,7 +293,6 @@ class PassphraseModel:
         if word_count > self.max_word_count:
             raise ValueError(f"Word count cannot exceed {self.max_word_count}")
         
-        available_words = self.word_repository.get_word_count()
         if word_count > available_words:
             raise ValueError(f"Cannot generate {word_count} words from {available_words} available words")
     
@@ -2,9 +2,208 @@
 Word repository - Manages word data for passphrase generation using NLTK corpus.
 """
 
-from typing import List, Optional, Set
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+import functools
+import os
 import secrets
 import string
+import threading
+
+
+# Shared CSPRNG instance for word selection
+_SYSTEM_RANDOM = secrets.SystemRandom()
+
+# Common English words used when the NLTK corpus is unavailable
+_FALLBACK_WORDS: Tuple[str, ...] = (
+    "able", "about", "above", "across", "after", "again", "against", "all", "almost", "alone",
+    "along", "already", "also", "although", "always", "among", "another", "any", "anyone", "anything",
+    "anywhere", "are", "area", "around", "back", "based", "became", "because", "become", "been",
+    "before", "began", "being", "below", "between", "both", "bring", "but", "came", "can",
+    "come", "could", "did", "different", "down", "during", "each", "early", "even", "every",
+    "example", "far", "few", "find", "first", "for", "found", "from", "get", "give",
+    "good", "great", "group", "hand", "hard", "has", "have", "hear", "help", "here",
+    "high", "home", "how", "however", "include", "into", "its", "just", "know", "large",
+    "last", "later", "learn", "left", "level", "life", "line", "list", "live", "local",
+    "long", "look", "made", "make", "man", "many", "may", "member", "might", "most",
+    "move", "much", "must", "name", "need", "never", "new", "next", "not", "now",
+    "number", "off", "old", "once", "only", "open", "other", "over", "own", "part",
+    "people", "place", "point", "present", "program", "put", "right", "run", "said", "same",
+    "school", "see", "seem", "several", "should", "show", "small", "some", "something", "still",
+    "such", "system", "take", "than", "that", "the", "their", "them", "then", "there",
+    "these", "they", "thing", "think", "this", "those", "through", "time", "today", "together",
+    "too", "turn", "two", "under", "until", "use", "used", "using", "very", "want",
+    "water", "way", "well", "were", "what", "when", "where", "which", "while", "who",
+    "will", "with", "within", "without", "work", "world", "would", "write", "year", "years"
+)
+
+# Bump when the NLTK filtering rules change so stale caches are ignored
+_WORD_CACHE_VERSION = 1
+
+# Fewest filtered NLTK words worth using. Smaller lists fall back to the
+# built-in words and are never cached, so a shorter cache file is damaged.
+_MIN_NLTK_WORDS = 100
+
+# Raw NLTK words corpus, loaded at most once per process
+_NLTK_WORDS_CACHE: Optional[FrozenSet[str]] = None
+
+# Serializes corpus loading and filtering; NLTK's lazy corpus loader is not
+# thread-safe, and repositories may be built from several threads at once
+# (e.g. the PASSPHRASES_PREWARM thread and the main thread). Reentrant since
+# _build_filtered_words() calls _load_nltk_corpus() while holding it.
+_corpus_lock = threading.RLock()
+
+
+def _load_nltk_corpus() -> FrozenSet[str]:
+    """
+    Load the NLTK words corpus, importing NLTK only on the first call.
+    
+    Returns:
+        FrozenSet[str]: All words in the corpus
+        
+    Raises:
+        ImportError: If NLTK is not installed
+        LookupError: If the corpus is missing and cannot be downloaded
+    """
+    global _NLTK_WORDS_CACHE
+    with _corpus_lock:
+        if _NLTK_WORDS_CACHE is None:
+            import nltk
+            from nltk.corpus import words
+            
+            # Try to use the words corpus
+            try:
+                corpus = words.words()
+            except LookupError:
+                # Download the words corpus if not available
+                nltk.download('words', quiet=True)
+                corpus = words.words()
+            
+            _NLTK_WORDS_CACHE = frozenset(corpus)
+        
+        return _NLTK_WORDS_CACHE
+
+
+def _word_cache_dir() -> Path:
+    """
+    Get the directory used to cache filtered word lists.
+    
+    Returns:
+        Path: User cache directory for this package
+    """
+    try:
+        from platformdirs import user_cache_dir
+        return Path(user_cache_dir('passphrases'))
+    except ImportError:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return Path(base) / 'passphrases'
+
+
+def _read_word_cache(path: Path) -> Optional[List[str]]:
+    """
+    Read a cached word list.
+    
+    Args:
+        path: Cache file path
+        
+    Returns:
+        List of cached words, or None if the cache is missing or unreadable
+    """
+    try:
+        words = path.read_text(encoding='utf-8').split('\n')
+    except (OSError, UnicodeDecodeError):
+        return None
+    
+    return words if words and words[0] else None
+
+
+def _is_valid_word_cache(words: List[str], min_length: int, max_length: int) -> bool:
+    """
+    Check that a cached word list is what _build_filtered_words() would produce.
+    
+    A truncated, corrupted or edited cache must not become the word list,
+    since a small or repetitive list gives weak passphrases.
+    
+    Args:
+        words: Words read from the cache
+        min_length: Minimum word length to include
+        max_length: Maximum word length to include
+        
+    Returns:
+        bool: True if the words are filtered, unique, sorted and numerous enough
+    """
+    if len(words) < _MIN_NLTK_WORDS:
+        return False
+    
+    if not all(min_length <= len(word) <= max_length and word.islower() and word.isalpha()
+               for word in words):
+        return False
+    
+    # Strictly increasing means sorted with no duplicates
+    return all(a < b for a, b in zip(words, words[1:]))
+
+
+def _write_word_cache(path: Path, words: List[str]) -> None:
+    """
+    Write a word list to the cache, ignoring any filesystem errors.
+    
+    Args:
+        path: Cache file path
+        words: Words to cache
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text('\n'.join(words), encoding='utf-8')
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=8)
+def _build_filtered_words(min_length: int, max_length: int) -> Tuple[str, ...]:
+    """
+    Get the sorted NLTK words within a length range.
+    
+    Results are cached in memory per length range and on disk, so later
+    repositories and later runs skip loading and filtering the corpus.
+    Concurrent callers are serialized, so the corpus is never loaded by
+    two threads at once.
+    
+    Args:
+        min_length: Minimum word length to include
+        max_length: Maximum word length to include
+        
+    Returns:
+        Tuple[str, ...]: Filtered, sorted words
+        
+    Raises:
+        ImportError: If NLTK is not installed
+        LookupError: If the corpus is missing and cannot be downloaded
+    """
+    with _corpus_lock:
+        cache_path = _word_cache_dir() / f"words-v{_WORD_CACHE_VERSION}-{min_length}-{max_length}.txt"
+        cached_words = _read_word_cache(cache_path)
+        if cached_words is not None and _is_valid_word_cache(cached_words, min_length, max_length):
+            return tuple(cached_words)
+        
+        word_set = _load_nltk_corpus()
+        
+        # Filter words by length and lowercase alphabetic characters only; the
+        # corpus is already a set and islower() means no lowercasing is needed.
+        # islower() runs before isalpha() since it rejects the capitalized proper
+        # nouns in the corpus
+        filtered_words = sorted(
+            word for word in word_set
+            if (min_length <= len(word) <= max_length and 
+                word.islower() and 
+                word.isalpha())
+        )
+        
+        if len(filtered_words) >= _MIN_NLTK_WORDS:
+            _write_word_cache(cache_path, filtered_words)
+        
+        return tuple(filtered_words)
 
 
 class WordRepository:
@@ -24,39 +223,26 @@ class WordRepository:
         """
         self.min_length = min_length
         self.max_length = max_length
-        self._words = custom_words or self._load_nltk_words()
+        # A tuple shared with other repositories until the first modification
+        self._words: Union[List[str], Tuple[str, ...]] = custom_words or self._load_nltk_words()
+        self._words_snapshot: Optional[Tuple[str, ...]] = None
+        self._capitalized_snapshot: Optional[Tuple[str, ...]] = None
+        
+        # Word -> list position, built on the first removal
+        self._word_index: Optional[Dict[str, int]] = None
+        self._index_has_duplicates = False
     
-    def _load_nltk_words(self) -> List[str]:
+    def _load_nltk_words(self) -> Union[List[str], Tuple[str, ...]]:
         """
         Load words from NLTK corpus with fallback to built-in words.
         
         Returns:
-            List[str]: Filtered word collection
+            Filtered word collection; NLTK words are returned as a shared tuple
         """
         try:
-            import nltk
-            from nltk.corpus import words
-            
-            # Try to use the words corpus
-            try:
-                word_set = set(words.words())
-            except LookupError:
-                # Download the words corpus if not available
-                nltk.download('words', quiet=True)
-                word_set = set(words.words())
-            
-            # Filter words by length and alphabetic characters only
-            filtered_words = [
-                word.lower() for word in word_set
-                if (self.min_length <= len(word) <= self.max_length and 
-                    word.isalpha() and 
-                    word.islower())
-            ]
+            filtered_words = _build_filtered_words(self.min_length, self.max_length)
             
-            # Remove duplicates and sort
-            filtered_words = sorted(list(set(filtered_words)))
-            
-            if len(filtered_words) < 100:  # Fallback if too few words
+            if len(filtered_words) < _MIN_NLTK_WORDS:  # Fallback if too few words
                 return self._get_fallback_words()
             
             return filtered_words
@@ -75,31 +261,8 @@ class WordRepository:
         Returns:
             List[str]: Fallback collection of common English words
         """
-        fallback_words = [
-            # Common English words suitable for passphrases
-            "able", "about", "above", "across", "after", "again", "against", "all", "almost", "alone",
-            "along", "already", "also", "although", "always", "among", "another", "any", "anyone", "anything",
-            "anywhere", "are", "area", "around", "back", "based", "became", "because", "become", "been",
-            "before", "began", "being", "below", "between", "both", "bring", "but", "came", "can",
-            "come", "could", "did", "different", "down", "during", "each", "early", "even", "every",
-            "example", "far", "few", "find", "first", "for", "found", "from", "get", "give",
-            "good", "great", "group", "hand", "hard", "has", "have", "hear", "help", "here",
-            "high", "home", "how", "however", "include", "into", "its", "just", "know", "large",
-            "last", "later", "learn", "left", "level", "life", "line", "list", "live", "local",
-            "long", "look", "made", "make", "man", "many", "may", "member", "might", "most",
-            "move", "much", "must", "name", "need", "never", "new", "next", "not", "now",
-            "number", "off", "old", "once", "only", "open", "other", "over", "own", "part",
-            "people", "place", "point", "present", "program", "put", "right", "run", "said", "same",
-            "school", "see", "seem", "several", "should", "show", "small", "some", "something", "still",
-            "such", "system", "take", "than", "that", "the", "their", "them", "then", "there",
-            "these", "they", "thing", "think", "this", "those", "through", "time", "today", "together",
-            "too", "turn", "two", "under", "until", "use", "used", "using", "very", "want",
-            "water", "way", "well", "were", "what", "when", "where", "which", "while", "who",
-            "will", "with", "within", "without", "work", "world", "would", "write", "year", "years"
-        ]
-        
         # Filter by length requirements
-        return [word for word in fallback_words 
+        return [word for word in _FALLBACK_WORDS
                 if self.min_length <= len(word) <= self.max_length]
     
     def get_random_words(self, count: int) -> List[str]:
@@ -120,7 +283,39 @@ class WordRepository:
         if count > len(self._words):
             raise ValueError(f"Cannot select {count} words from {len(self._words)} available words")
         
-        return secrets.SystemRandom().sample(self._words, count)
+        return _SYSTEM_RANDOM.sample(self._words, count)
+    
+    def get_random_words_bulk(self, n: int, count: int, capitalize: bool = False) -> List[List[str]]:
+        """
+        Get several groups of random words, drawing all of them in one call.
+        
+        Words are unique within each group, as with get_random_words().
+        
+        Args:
+            n: Number of groups to retrieve
+            count: Number of words per group
+            capitalize: Whether to return the words capitalized
+            
+        Returns:
+            List[List[str]]: n lists of randomly selected words
+            
+        Raises:
+            ValueError: If count is less than 1 or greater than available words
+        """
+        if count < 1:
+            raise ValueError("Word count must be at least 1")
+        if count > len(self._words):
+            raise ValueError(f"Cannot select {count} words from {len(self._words)} available words")
+        
+        words = self.get_capitalized_words() if capitalize else self.get_words_snapshot()
+        picks = _SYSTEM_RANDOM.choices(words, k=max(n, 0) * count)
+        groups = [picks[i:i + count] for i in range(0, len(picks), count)]
+        
+        # choices() samples with replacement; redraw the rare group with a repeated word
+        return [
+            group if len(set(group)) == count else _SYSTEM_RANDOM.sample(words, count)
+            for group in groups
+        ]
     
     def get_all_words(self) -> List[str]:
         """
@@ -129,7 +324,49 @@ class WordRepository:
         Returns:
             List[str]: All available words
         """
-        return self._words.copy()
+        return list(self.get_words_snapshot())
+    
+    def get_words_snapshot(self) -> Tuple[str, ...]:
+        """
+        Get all words in the repository as a read-only tuple.
+        
+        Unlike get_all_words(), no copy is made: the tuple is cached until
+        the repository is modified, so repeated calls are free.
+        
+        Returns:
+            Tuple[str, ...]: All available words
+        """
+        if self._words_snapshot is None:
+            words = self._words
+            self._words_snapshot = words if isinstance(words, tuple) else tuple(words)
+        return self._words_snapshot
+    
+    def get_capitalized_words(self) -> Tuple[str, ...]:
+        """
+        Get all words in the repository with their first letter capitalized.
+        
+        The tuple is parallel to get_words_snapshot() and cached the same
+        way. It is meant for bulk generation, where capitalizing the whole
+        list once is cheaper than capitalizing every drawn word; single
+        passphrases capitalize only their chosen words instead.
+        
+        Returns:
+            Tuple[str, ...]: All available words, capitalized
+        """
+        if self._capitalized_snapshot is None:
+            self._capitalized_snapshot = tuple(map(str.capitalize, self.get_words_snapshot()))
+        return self._capitalized_snapshot
+    
+    def _mutable_words(self) -> List[str]:
+        """
+        Get the word list for modification.
+        
+        Returns:
+            List[str]: Word list, copied from the shared tuple on first use
+        """
+        if isinstance(self._words, tuple):
+            self._words = list(self._words)
+        return self._words
     
     def add_words(self, words: List[str]) -> None:
         """
@@ -138,23 +375,49 @@ class WordRepository:
         Args:
             words: List of words to add
         """
-        self._words.extend(word.lower().strip() for word in words if word.strip())
+        self._mutable_words().extend(word.lower().strip() for word in words if word.strip())
+        self._words_snapshot = None
+        self._word_index = None
+        self._capitalized_snapshot = None
     
     def remove_word(self, word: str) -> bool:
         """
         Remove a word from the repository.
         
+        The last word is moved into the freed slot, so removal takes constant
+        time (after a one-off index build) but does not preserve word order.
+        
         Args:
             word: Word to remove
             
         Returns:
             bool: True if word was removed, False if not found
         """
-        try:
-            self._words.remove(word.lower().strip())
-            return True
-        except ValueError:
-            return False
+        word = word.lower().strip()
+        words = self._mutable_words()
+        
+        if self._word_index is None:
+            self._word_index = {w: i for i, w in enumerate(words)}
+            self._index_has_duplicates = len(self._word_index) != len(words)
+        index = self._word_index
+        
+        position = index.pop(word, None)
+        if position is None:
+            # Only duplicates of an already removed word are missing from the index
+            if not self._index_has_duplicates or word not in words:
+                return False
+            position = words.index(word)
+        
+        last_position = len(words) - 1
+        last_word = words.pop()
+        if position != last_position:
+            words[position] = last_word
+            if index.get(last_word) == last_position:
+                index[last_word] = position
+        
+        self._words_snapshot = None
+        self._capitalized_snapshot = None
+        return True
     
     def get_word_count(self) -> int:
         """
@@ -163,4 +426,29 @@ class WordRepository:
         Returns:
             int: Number of words available
         """
-        return len(self._words)
\ No newline at end of file
+        return len(self._words)
+
+
+_default_repository_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _create_default_repository() -> WordRepository:
+    """Create the default word repository (called once per process)."""
+    return WordRepository()
+
+
+def get_word_repository() -> WordRepository:
+    """
+    Get the process-wide default word repository.
+    
+    The NLTK corpus is loaded only once, on the first call; models and
+    controllers created without an explicit repository all share this
+    instance, so words added to or removed from it are seen by all of them.
+    Concurrent first callers wait for the same load instead of racing.
+    
+    Returns:
+        WordRepository: Shared repository with default settings
+    """
+    with _default_repository_lock:
+        return _create_default_repository()
\ No newline at end of file
@@ -65,8 +65,9 @@ class CLIView:
         title = "Generated Passphrases"
         self.formatter.print_output(self.formatter.format_title(title))
         
-        for i, passphrase in enumerate(passphrases, 1):
-            self.formatter.print_output(f"{i:2d}. {self.formatter.colorize(passphrase, 'green')}")
+        colorize = self.formatter.colorize
+        lines = [f"{i:2d}. {colorize(passphrase, 'green')}" for i, passphrase in enumerate(passphrases, 1)]
+        self.formatter.print_output("\n".join(lines))
     
     def display_error(self, error_message: str) -> None:
         """
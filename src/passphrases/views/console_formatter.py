@@ -2,10 +2,65 @@
 Console formatter - Handles formatting output for console display.
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+import functools
 import sys
 
 
+# ANSI color codes; read-only since every formatter shares this table
+_COLORS: Mapping[str, str] = MappingProxyType({
+    'reset': '\033[0m',
+    'red': '\033[91m',
+    'green': '\033[92m',
+    'yellow': '\033[93m',
+    'blue': '\033[94m',
+    'magenta': '\033[95m',
+    'cyan': '\033[96m',
+    'white': '\033[97m',
+    'bold': '\033[1m',
+    'underline': '\033[4m'
+})
+
+# Prepared (prefix, suffix) pairs so colorize does a single lookup
+_COLOR_PAIRS: Dict[str, Tuple[str, str]] = {
+    name: (code, _COLORS['reset']) for name, code in _COLORS.items()
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _pretty_key(key: str) -> str:
+    """
+    Turn a statistics key into a display label (e.g. 'word_count' -> 'Word Count').
+    
+    Args:
+        key: Statistics key
+        
+    Returns:
+        str: Display label
+    """
+    return key.replace('_', ' ').title()
+
+
+@functools.lru_cache(maxsize=32)
+def _item_affixes(label: str, use_colors: bool) -> Tuple[str, str]:
+    """
+    Build the text placed before and after a generated item's value.
+    
+    Args:
+        label: Label for the item
+        use_colors: Whether ANSI color codes are used
+        
+    Returns:
+        Tuple[str, str]: Prefix and suffix around the value
+    """
+    if not use_colors:
+        return f"{label}:\n  ", ""
+    
+    bold, green, reset = _COLORS['bold'], _COLORS['green'], _COLORS['reset']
+    return f"{bold}{label}:{reset}\n  {green}", reset
+
+
 class ConsoleFormatter:
     """
     Handles formatting and displaying output to the console.
@@ -20,19 +75,10 @@ class ConsoleFormatter:
         """
         self.use_colors = use_colors and sys.stdout.isatty()
         
-        # ANSI color codes
-        self.colors = {
-            'reset': '\033[0m',
-            'red': '\033[91m',
-            'green': '\033[92m',
-            'yellow': '\033[93m',
-            'blue': '\033[94m',
-            'magenta': '\033[95m',
-            'cyan': '\033[96m',
-            'white': '\033[97m',
-            'bold': '\033[1m',
-            'underline': '\033[4m'
-        }
+        # ANSI color codes (a read-only view) and prepared (prefix, suffix)
+        # pairs, shared by all instances
+        self.colors = _COLORS
+        self._color_pairs = _COLOR_PAIRS
     
     def colorize(self, text: str, color: str) -> str:
         """
@@ -45,10 +91,11 @@ class ConsoleFormatter:
         Returns:
             str: Colored text if colors are enabled, otherwise plain text
         """
-        if not self.use_colors or color not in self.colors:
+        if not self.use_colors:
             return text
         
-        return f"{self.colors[color]}{text}{self.colors['reset']}"
+        pair = self._color_pairs.get(color)
+        return f"{pair[0]}{text}{pair[1]}" if pair else text
     
     def format_title(self, title: str) -> str:
         """
@@ -121,11 +168,8 @@ class ConsoleFormatter:
         Returns:
             str: Formatted output
         """
-        lines = []
-        lines.append(self.colorize(f"{label}:", 'bold'))
-        lines.append(f"  {self.colorize(value, 'green')}")
-        
-        return "\n".join(lines)
+        prefix, suffix = _item_affixes(label, self.use_colors)
+        return f"{prefix}{value}{suffix}"
     
     def format_statistics(self, stats: Dict[str, Any]) -> str:
         """
@@ -137,11 +181,11 @@ class ConsoleFormatter:
         Returns:
             str: Formatted statistics
         """
-        lines = [self.colorize("Statistics:", 'bold')]
+        colorize = self.colorize
+        lines = [colorize("Statistics:", 'bold')]
         
         for key, value in stats.items():
-            formatted_key = key.replace('_', ' ').title()
-            lines.append(f"  {formatted_key}: {self.colorize(str(value), 'cyan')}")
+            lines.append(f"  {_pretty_key(key)}: {colorize(str(value), 'cyan')}")
         
         return "\n".join(lines)
     
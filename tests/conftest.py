@@ -0,0 +1,47 @@
+"""
+Shared pytest fixtures for the passphrases test suite.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def word_cache_dir(tmp_path_factory):
+    """Keep the on-disk word cache in a temporary directory for the session."""
+    from passphrases.models import word_repository
+    
+    cache_home = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(cache_home))
+        mp.setattr(word_repository, "_word_cache_dir", lambda: cache_home / "passphrases")
+        word_repository._build_filtered_words.cache_clear()
+        yield cache_home / "passphrases"
+    word_repository._build_filtered_words.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def word_repo():
+    """Word repository shared by all read-only tests."""
+    from passphrases.models.word_repository import WordRepository
+    return WordRepository()
+
+
+@pytest.fixture(scope="session")
+def passphrase_model(word_repo):
+    """Passphrase model backed by the shared word repository."""
+    from passphrases.models.passphrase_model import PassphraseModel
+    return PassphraseModel(word_repo)
+
+
+@pytest.fixture(scope="session")
+def app_controller(word_repo):
+    """Application controller backed by the shared word repository."""
+    from passphrases.controllers.application_controller import ApplicationController
+    return ApplicationController(word_repository=word_repo)
+
+
+@pytest.fixture
+def isolated_word_repo():
+    """Fresh single-word repository for tests that mutate it."""
+    from passphrases.models.word_repository import WordRepository
+    return WordRepository(['test'])
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""
+Assertion helpers shared by the passphrases tests.
+"""
+
+from typing import List
+
+
+def assert_passphrase(passphrase: str, word_count: int, separator: str = "-") -> List[str]:
+    """
+    Assert that a passphrase is a string with the expected number of words.
+    
+    Args:
+        passphrase: Passphrase to check
+        word_count: Expected number of words
+        separator: Separator between words
+        
+    Returns:
+        List[str]: The words of the passphrase
+    """
+    __tracebackhide__ = True
+    assert isinstance(passphrase, str)
+    words = passphrase.split(separator)
+    assert len(words) == word_count
+    return words
\ No newline at end of file
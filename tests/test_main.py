@@ -5,9 +5,7 @@ Tests for the passphrases package (NLTK-based passphrase generation library).
 import pytest
 from passphrases import hello_world, generate_passphrase
 from passphrases.main import generate_passphrase as main_generate_passphrase
-from passphrases.models.passphrase_model import PassphraseModel
-from passphrases.models.word_repository import WordRepository
-from passphrases.controllers.application_controller import ApplicationController
+from .helpers import assert_passphrase
 
 
 class TestBackwardsCompatibility:
@@ -21,117 +19,354 @@ class TestBackwardsCompatibility:
     
     def test_generate_passphrase_package_level(self):
         """Test passphrase generation from package level."""
-        passphrase = generate_passphrase()
-        assert isinstance(passphrase, str)
-        assert len(passphrase.split("-")) >= 3  # Should have at least 3 words
+        assert_passphrase(generate_passphrase(), 4)
         
         # Test custom parameters
-        passphrase = generate_passphrase(word_count=3, separator="_")
-        assert len(passphrase.split("_")) == 3
+        assert_passphrase(generate_passphrase(word_count=3, separator="_"), 3, "_")
     
     def test_main_generate_passphrase(self):
         """Test passphrase generation from main module."""
-        passphrase = main_generate_passphrase()
-        assert isinstance(passphrase, str)
-        assert len(passphrase.split("-")) >= 3  # Should have at least 3 words
+        assert_passphrase(main_generate_passphrase(), 4)
 
 
 class TestWordRepository:
     """Test the word repository model."""
     
-    def test_initialization(self):
+    def test_initialization(self, word_repo):
         """Test repository initialization."""
-        repo = WordRepository()
-        assert repo.get_word_count() > 0
+        from passphrases.models.word_repository import WordRepository
+        
+        assert word_repo.get_word_count() > 0
         
         custom_words = ['test', 'custom', 'words']
         custom_repo = WordRepository(custom_words)
         assert custom_repo.get_word_count() == 3
     
-    def test_get_random_words(self):
+    @pytest.mark.parametrize("n", [1, 3, 5, 10, 50])
+    def test_get_random_words(self, word_repo, n):
         """Test getting random words."""
-        repo = WordRepository()
-        words = repo.get_random_words(3)
-        assert len(words) == 3
-        assert len(set(words)) == 3  # Should be unique
+        for _ in range(20):
+            words = word_repo.get_random_words(n)
+            assert len(words) == n
+            assert len(set(words)) == n  # Should be unique
+    
+    def test_get_random_words_bulk(self, word_repo):
+        """Test getting several groups of random words at once."""
+        groups = word_repo.get_random_words_bulk(10, 4)
+        assert len(groups) == 10
+        assert all(len(group) == 4 and len(set(group)) == 4 for group in groups)
+        
+        with pytest.raises(ValueError):
+            word_repo.get_random_words_bulk(10, 0)
     
-    def test_add_remove_words(self):
+    def test_add_remove_words(self, isolated_word_repo):
         """Test adding and removing words."""
-        repo = WordRepository(['test'])
+        repo = isolated_word_repo
         initial_count = repo.get_word_count()
         
         repo.add_words(['new', 'words'])
         assert repo.get_word_count() == initial_count + 2
+        assert 'new' in repo.get_all_words()
+        
+        assert repo.get_all_words() == ['test', 'new', 'words']
+        assert repo.get_words_snapshot() == ('test', 'new', 'words')
         
         assert repo.remove_word('test') is True
         assert repo.remove_word('nonexistent') is False
+        assert 'test' not in repo.get_all_words()
+    
+    def test_remove_many_words(self):
+        """Test removing words, including duplicates, keeps the repository consistent."""
+        from passphrases.models.word_repository import WordRepository
+        repo = WordRepository(['alpha', 'beta', 'gamma', 'delta', 'beta'])
+        
+        assert repo.remove_word('alpha') is True
+        assert repo.remove_word('beta') is True
+        assert repo.remove_word('beta') is True
+        assert repo.remove_word('beta') is False
+        assert sorted(repo.get_all_words()) == ['delta', 'gamma']
+        
+        repo.add_words(['omega'])
+        assert repo.remove_word('gamma') is True
+        assert sorted(repo.get_all_words()) == ['delta', 'omega']
+    
+    def test_word_cache_round_trip(self, tmp_path):
+        """Test writing and reading the on-disk word cache."""
+        from passphrases.models.word_repository import _read_word_cache, _write_word_cache
+        cache_path = tmp_path / "cache" / "words.txt"
+        assert _read_word_cache(cache_path) is None
+        
+        _write_word_cache(cache_path, ['alpha', 'beta', 'gamma'])
+        assert _read_word_cache(cache_path) == ['alpha', 'beta', 'gamma']
+    
+    def test_damaged_word_cache_is_rebuilt(self, word_cache_dir):
+        """Test that an invalid cache file is not used as the word list."""
+        from passphrases.models.word_repository import (
+            WordRepository,
+            _build_filtered_words,
+            _is_valid_word_cache,
+            _write_word_cache,
+        )
+        
+        cache_path = word_cache_dir / "words-v1-3-12.txt"
+        _write_word_cache(cache_path, ['password'] * 100)
+        _build_filtered_words.cache_clear()
+        try:
+            words = WordRepository().get_all_words()
+        finally:
+            _build_filtered_words.cache_clear()
+        
+        assert len(set(words)) > 1
+        assert not _is_valid_word_cache(['password'] * 100, 3, 12)
+        assert not _is_valid_word_cache(['apple', 'pear'], 3, 12)
+        assert not _is_valid_word_cache([f"word{i}" for i in range(100)], 3, 12)
+        
+        words = sorted({chr(97 + i // 26) + chr(97 + i % 26) + 'x' for i in range(200)})
+        assert _is_valid_word_cache(words, 3, 12)
+        assert not _is_valid_word_cache(words[::-1], 3, 12)
+    
+    def test_shared_default_repository(self):
+        """Test that default models and controllers share one repository."""
+        from passphrases.models.passphrase_model import PassphraseModel
+        from passphrases.models.word_repository import get_word_repository
+        from passphrases.controllers.application_controller import ApplicationController
+        
+        repo = get_word_repository()
+        assert get_word_repository() is repo
+        assert PassphraseModel().word_repository is repo
+        assert ApplicationController().passphrase_controller.word_repository is repo
 
 
 class TestPassphraseModel:
     """Test the passphrase model."""
     
-    def test_initialization(self):
+    def test_initialization(self, passphrase_model):
         """Test model initialization."""
-        model = PassphraseModel()
-        assert model.default_word_count == 4
-        assert model.default_separator == "-"
+        assert passphrase_model.default_word_count == 4
+        assert passphrase_model.default_separator == "-"
     
-    def test_generate_passphrase(self):
+    def test_generate_passphrase(self, passphrase_model):
         """Test passphrase generation."""
-        model = PassphraseModel()
-        passphrase = model.generate()
-        
-        assert isinstance(passphrase, str)
-        assert len(passphrase.split("-")) == 4
+        assert_passphrase(passphrase_model.generate(), 4)
     
-    def test_generate_with_parameters(self):
+    @pytest.mark.parametrize("word_count,separator", [(2, " "), (3, "_"), (6, ".")])
+    def test_generate_with_parameters(self, passphrase_model, word_count, separator):
         """Test passphrase generation with custom parameters."""
-        model = PassphraseModel()
-        
-        passphrase = model.generate(word_count=3, separator="_", capitalize=False)
-        words = passphrase.split("_")
-        assert len(words) == 3
+        passphrase = passphrase_model.generate(word_count=word_count, separator=separator, capitalize=False)
+        words = assert_passphrase(passphrase, word_count, separator)
         assert all(word.islower() for word in words)
     
-    def test_validate_word_count(self):
-        """Test word count validation."""
-        model = PassphraseModel()
+    def test_generate_with_custom_repository(self):
+        """Test generation with a repository overriding get_random_words(count)."""
+        from passphrases.models.passphrase_model import PassphraseModel
+        from passphrases.models.word_repository import WordRepository
+        
+        class FirstWordsRepository(WordRepository):
+            def get_random_words(self, count):
+                return self.get_all_words()[:count]
+        
+        model = PassphraseModel(FirstWordsRepository(['alpha', 'beta', 'gamma']))
+        assert model.generate(word_count=3) == "Alpha-Beta-Gamma"
+        assert model.generate(word_count=2, capitalize=False) == "alpha-beta"
+    
+    def test_compile_formatter(self, passphrase_model):
+        """Test specialized passphrase formatters."""
+        model = passphrase_model
+        
+        assert model.compile_formatter()(["apple", "pear"]) == "Apple-Pear"
+        assert model.compile_formatter("_", capitalize=False)(["apple", "pear"]) == "apple_pear"
+        assert model.compile_formatter("_") is model.compile_formatter("_")
+        
+        words = model.compile_formatter(" ", include_numbers=True)(["apple", "pear"]).split(" ")
+        assert [word[:-2] for word in words] == ["Apple", "Pear"]
+        assert all(word[-2:].isdigit() for word in words)
+    
+    def test_generate_bulk(self, passphrase_model):
+        """Test bulk passphrase generation on the model."""
+        passphrases = passphrase_model.generate_bulk(20, word_count=3, separator="_", capitalize=False)
+        assert len(passphrases) == 20
+        for passphrase in passphrases:
+            words = assert_passphrase(passphrase, 3, "_")
+            assert len(set(words)) == 3
         
         with pytest.raises(ValueError):
-            model._validate_word_count(1)  # Too low
+            passphrase_model.generate_bulk(5, word_count=1)
+    
+    def test_generate_bulk_fast(self, passphrase_model):
+        """Test NumPy-backed bulk passphrase generation."""
+        pytest.importorskip("numpy")
         
+        passphrases = passphrase_model.generate_bulk(50, word_count=4, include_numbers=True, fast=True)
+        assert len(passphrases) == 50
+        for passphrase in passphrases:
+            words = assert_passphrase(passphrase, 4)
+            assert len(set(words)) == 4
+            assert all(word[0].isupper() and word[-2:].isdigit() for word in words)
+    
+    @pytest.mark.parametrize("bad_count", [1, 0, 100, 999])
+    def test_validate_word_count(self, passphrase_model, bad_count):
+        """Test word count validation."""
         with pytest.raises(ValueError):
-            model._validate_word_count(100)  # Too high
+            passphrase_model._validate_word_count(bad_count)
     
-    def test_word_pool_info(self):
+    def test_word_pool_info(self, passphrase_model):
         """Test word pool information."""
-        model = PassphraseModel()
-        word_pool_size = model.get_word_pool_size()
+        word_pool_size = passphrase_model.get_word_pool_size()
         assert word_pool_size > 0
 
 
 class TestApplicationController:
     """Test the application controller."""
     
-    def test_initialization(self):
+    def test_initialization(self, app_controller):
         """Test controller initialization."""
-        app = ApplicationController()
-        assert app.passphrase_controller is not None
-        assert app.word_repository is not None
-        assert app.passphrase_model is not None
+        assert app_controller.passphrase_controller is not None
+        assert app_controller.word_repository is not None
+        assert app_controller.passphrase_model is not None
     
-    def test_quick_passphrase_generation(self):
+    def test_quick_passphrase_generation(self, app_controller):
         """Test quick passphrase generation method."""
-        app = ApplicationController()
-        
-        passphrase_result = app.generate_quick_passphrase()
+        passphrase_result = app_controller.generate_quick_passphrase()
         assert 'passphrase' in passphrase_result
         assert 'error' not in passphrase_result
         assert 'word_count' in passphrase_result
         assert 'word_pool_size' in passphrase_result
     
-    def test_hello_world_mvc(self):
-        """Test MVC version of hello world."""
+    def test_passphrase_result(self, app_controller):
+        """Test structured passphrase result."""
+        controller = app_controller.passphrase_controller
+        
+        result = controller.generate_passphrase_result(word_count=3, separator="_")
+        assert_passphrase(result.passphrase, 3, "_")
+        assert result.word_count == 3
+        assert result.separator == "_"
+        assert result.word_pool_size == app_controller.word_repository.get_word_count()
+        
+        with pytest.raises(ValueError):
+            controller.generate_passphrase_result(word_count=1)
+    
+    def test_result_uses_current_model_defaults(self):
+        """Test that result metadata follows changes to the model defaults."""
+        from passphrases.controllers.application_controller import ApplicationController
+        
         app = ApplicationController()
-        result = app.hello_world()
-        assert "Hello, World!" in result
\ No newline at end of file
+        app.passphrase_model.default_word_count = 6
+        app.passphrase_model.default_separator = "_"
+        
+        result = app.generate_quick_passphrase()
+        assert_passphrase(result['passphrase'], 6, "_")
+        assert result['word_count'] == 6
+        assert result['separator'] == "_"
+    
+    def test_bulk_passphrase_generation(self, app_controller):
+        """Test bulk passphrase generation."""
+        controller = app_controller.passphrase_controller
+        
+        passphrases = controller.generate_bulk_passphrases(
+            5, word_count=3, separator="_", capitalize=False
+        )
+        assert len(passphrases) == 5
+        for passphrase in passphrases:
+            words = assert_passphrase(passphrase, 3, "_")
+            assert len(set(words)) == 3
+            assert all(word.islower() for word in words)
+        
+        assert controller.generate_bulk_passphrases(3, word_count=1) == []
+    
+    def test_interactive_mode_dispatch(self, word_repo):
+        """Test that interactive commands reach the right view calls and quit stops the loop."""
+        from unittest import mock
+        from passphrases.controllers.application_controller import ApplicationController
+        from passphrases.views.cli_view import CLIView
+        
+        view = mock.Mock(spec=CLIView)
+        # KeyboardInterrupt only ends the loop if 'q' failed to
+        view.prompt_input.side_effect = ['help', 'stats', 'bulk generate 3 x', 'bogus', 'q', KeyboardInterrupt]
+        app = ApplicationController(view=view, word_repository=word_repo)
+        
+        app.run_interactive_mode()
+        
+        assert view.prompt_input.call_count == 5
+        view.display_welcome.assert_called_once_with()
+        view.display_help.assert_called_once_with()
+        view.display_word_repository_stats.assert_called_once()
+        (passphrases,), _ = view.display_bulk_passphrases.call_args
+        assert len(passphrases) == 3
+        view.display_error.assert_called_once_with("Unknown command: bogus")
+        view.display_info.assert_any_call("Goodbye!")
+    
+    def test_hello_world_mvc(self, app_controller):
+        """Test MVC version of hello world."""
+        result = app_controller.hello_world()
+        assert "Hello, World!" in result
+        assert result == hello_world()
+
+
+class TestConsoleFormatter:
+    """Test the console formatter."""
+    
+    @staticmethod
+    def _formatter(use_colors):
+        """Create a formatter with colors forced on or off."""
+        from passphrases.views.console_formatter import ConsoleFormatter
+        formatter = ConsoleFormatter()
+        formatter.use_colors = use_colors
+        return formatter
+    
+    @pytest.mark.parametrize("use_colors", [True, False])
+    def test_colorize_follows_use_colors(self, use_colors):
+        """Test that colorize checks use_colors on every call."""
+        formatter = self._formatter(use_colors)
+        expected = "\033[92mx\033[0m" if use_colors else "x"
+        assert formatter.colorize("x", "green") == expected
+        assert formatter.colorize("x", "no-such-color") == "x"
+    
+    @pytest.mark.parametrize("use_colors", [True, False])
+    def test_format_generated_item(self, use_colors):
+        """Test generated item output matches its colorized parts."""
+        formatter = self._formatter(use_colors)
+        expected = f"{formatter.colorize('Passphrase:', 'bold')}\n  {formatter.colorize('A-B', 'green')}"
+        assert formatter.format_generated_item("Passphrase", "A-B") == expected
+        assert formatter.format_generated_item("Passphrase", "C-D") == expected.replace("A-B", "C-D")
+    
+    def test_format_statistics(self):
+        """Test statistics keys are turned into labels."""
+        formatter = self._formatter(False)
+        output = formatter.format_statistics({'word_count': 4, 'word_pool_size': 190})
+        assert output == "Statistics:\n  Word Count: 4\n  Word Pool Size: 190"
+    
+    def test_color_tables_are_shared(self):
+        """Test that formatters share one read-only set of color tables."""
+        formatter = self._formatter(True)
+        assert formatter.colors is self._formatter(False).colors
+        
+        with pytest.raises(TypeError):
+            formatter.colors['green'] = ''
+
+
+class TestCommandLine:
+    """Test the command-line interface."""
+    
+    @pytest.mark.parametrize("argv", [
+        ["passphrase", "--words", "5", "--separator", "_"],
+        ["--words", "5", "--separator", "_", "passphrase"],
+    ])
+    def test_passphrase_options_in_any_position(self, monkeypatch, capsys, argv):
+        """Test that options are accepted before or after the command."""
+        from passphrases.main import main
+        monkeypatch.setattr("sys.argv", ["passphrases"] + argv)
+        
+        main()
+        
+        passphrase = capsys.readouterr().out.split("Passphrase:\n", 1)[1].split("\n", 1)[0].strip()
+        assert_passphrase(passphrase, 5, "_")
+    
+    @pytest.mark.parametrize("argv", [["demo", "--words", "5"], ["--words", "5", "demo"]])
+    def test_demo_accepts_passphrase_options(self, monkeypatch, capsys, argv):
+        """Test that the demo command does not reject passphrase options."""
+        from passphrases.main import main
+        monkeypatch.setattr("sys.argv", ["passphrases"] + argv)
+        
+        main()
+        
+        assert "Passphrase Generation Demo" in capsys.readouterr().out
\ No newline at end of file